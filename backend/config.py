@@ -1,27 +1,51 @@
-import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
+from typing import Tuple
 
-# Load environment variables
-load_dotenv()
+from pydantic import ValidationInfo, field_validator
+from pydantic_settings import BaseSettings, SettingsConfigDict
+
+
+class Settings(BaseSettings):
+    # Values are read from the environment, then from the .env file next to this module
+    model_config = SettingsConfigDict(
+        env_file=Path(__file__).with_name(".env"),
+        extra="ignore"
+    )
+
+    # Deployment environment, "dev" relaxes CORS to allow any origin and enables auto-reload
+    ENV: str = "production"
 
-class Config:
     # iDRAC configuration
-    IDRAC_IP = os.getenv("IDRAC_IP", "10.88.51.66")
-    IDRAC_USERNAME = os.getenv("IDRAC_USERNAME", "root")
-    IDRAC_PASSWORD = os.getenv("IDRAC_PASSWORD", "1111")
-    
+    IDRAC_IP: str = "10.88.51.66"
+    IDRAC_USERNAME: str = "root"
+    IDRAC_PASSWORD: str = "1111"
+
     # API configuration
-    API_HOST = os.getenv("API_HOST", "0.0.0.0")
-    API_PORT = int(os.getenv("API_PORT", "8000"))
-    
+    API_HOST: str = "0.0.0.0"
+    API_PORT: int = 8000
+
     # Monitoring configuration
-    REFRESH_INTERVAL = int(os.getenv("REFRESH_INTERVAL", "300"))  # 5 minutes in seconds
-    
+    REFRESH_INTERVAL: int = 300  # 5 minutes in seconds
+
     # CORS configuration
-    ALLOWED_ORIGINS = [
+    ALLOWED_ORIGINS: Tuple[str, ...] = (
         "http://localhost:3000",
         "http://localhost:5173",
         "http://127.0.0.1:3000",
         "http://127.0.0.1:5173",
-        "*"  # Allow all origins for development
-    ]
\ No newline at end of file
+    )
+
+    @field_validator("ALLOWED_ORIGINS")
+    @classmethod
+    def allow_all_origins_in_dev(cls, origins: Tuple[str, ...], info: ValidationInfo) -> Tuple[str, ...]:
+        """Allow all origins for development only"""
+        if info.data.get("ENV") == "dev" and "*" not in origins:
+            return origins + ("*",)
+        return origins
+
+
+@lru_cache
+def get_settings() -> Settings:
+    """Parse and validate settings once per process"""
+    return Settings()
@@ -3,18 +3,84 @@ import re
 
 import requests
 import json
+import logging
 import warnings
+from dataclasses import dataclass
 from typing import Dict, List, Optional, Any
+from urllib.parse import quote
 from datetime import datetime
 import urllib3
+from urllib3.util.retry import Retry
 import ssl
 import sys
 import time
+import threading
+import heapq
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+
+logger = logging.getLogger(__name__)
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # the stdlib decoder is slower on large payloads but accepts bytes too
+    _json_loads = json.loads
 
 # Disable SSL warnings for self-signed certificates
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
 
+# Status lookup keyed on lowercase (State, Health); _ANY matches any value
+_ANY = "*"
+_STATUS_TABLE = {
+    (_ANY, "critical"): "critical",
+    (_ANY, "warning"): "warning",
+    ("standbyspare", "ok"): "standby",
+    (_ANY, "ok"): "healthy",
+    ("absent", _ANY): "offline",
+    ("unavailableoffline", _ANY): "offline",
+}
+
+# Health values from worst to best, used to pick between Health and HealthRollup
+_HEALTH_RANK = {"critical": 0, "warning": 1, "ok": 2}
+_UNRANKED = len(_HEALTH_RANK)
+
+_alert_timestamp = attrgetter("timestamp")
+
+# (record field, Redfish property, default) for values copied straight from a resource
+_DISK_FIELD_MAP = (
+    ("name", "Name", "Unknown"),
+    ("interface", "Protocol", "Unknown"),
+    ("model", "Model", "Unknown"),
+    ("serialNumber", "SerialNumber", "Unknown"),
+    ("manufacturer", "Manufacturer", "Unknown"),
+    ("mediaType", "MediaType", "Unknown"),
+)
+_VIRTUAL_DISK_FIELD_MAP = (
+    ("name", "Name", "Unknown"),
+    ("encrypted", "Encrypted", False),
+    ("optimumIOSize", "OptimumIOSizeBytes", "N/A"),
+    ("blockSizeBytes", "BlockSizeBytes", "N/A"),
+)
+_SERVER_FIELD_MAP = (
+    ("name", "Name", "Unknown"),
+    ("model", "Model", "Unknown"),
+    ("manufacturer", "Manufacturer", "Unknown"),
+    ("serialNumber", "SerialNumber", "Unknown"),
+    ("powerState", "PowerState", "Unknown"),
+    ("biosVersion", "BiosVersion", "Unknown"),
+    ("systemType", "SystemType", "Physical"),
+    ("uuid", "UUID", ""),
+    ("hostName", "HostName", ""),
+    ("indicatorLED", "IndicatorLED", ""),
+)
+
+
+def _fields_from_map(source: dict, field_map: tuple) -> Dict[str, Any]:
+    """Copy the properties listed in a field map out of a Redfish resource"""
+    get = source.get
+    return {field: get(prop, default) for field, prop, default in field_map}
+
 
 # Custom adapter to handle weak DH keys
 class WeakDHAdapter(requests.adapters.HTTPAdapter):
@@ -34,155 +100,360 @@ class IDRACRedfishClient:
     """
     iDRAC Redfish API client for hardware monitoring
     Based on Dell's iDRAC-Redfish-Scripting repository
+
+    Every request is authenticated with HTTP basic auth. The client never logs
+    in through /redfish/v1/SessionService/Sessions: iDRAC caps the number of
+    concurrent Redfish sessions, and sessions leaked by parallel requests
+    would lock the monitor out until they time out.
     """
 
-    def __init__(self, idrac_ip: str, username: str, password: str):
+    # Seconds a GET response is served from cache, per kind of Redfish resource. The link
+    # collections (Storage, Drives, Volumes) change least; resources carrying Status or
+    # PowerState are cached just long enough to be shared by the stages of one refresh.
+    # Expired entries are revalidated by ETag, so a short TTL mostly costs a 304.
+    CACHE_TTL = {
+        "storage_collections": 600,
+        "system_info": 10,
+        "storage_controllers": 10,
+        "drive_details": 10,
+        "sel_logs": 10,
+    }
+
+    def __init__(self, idrac_ip: str, username: str, password: str, max_cache_ttl: Optional[float] = None):
+        """max_cache_ttl caps the TTL of every kind of resource, pass something below the
+        monitor's refresh interval so no refresh sees stale status or a stale disk list"""
+        if max_cache_ttl is not None:
+            self.CACHE_TTL = {kind: min(ttl, max_cache_ttl) for kind, ttl in self.CACHE_TTL.items()}
+
         self.idrac_ip = idrac_ip
         self.username = username
         self.password = password
         self.base_url = f"https://{idrac_ip}"
+        # (connect, read) seconds: fail fast on an unreachable iDRAC, allow slow responses
+        self.timeout = (5, 15)
 
         # Create session with custom adapter
         self.session = requests.Session()
         self.session.auth = (username, password)
         self.session.verify = False
 
-        # Mount custom adapter for weak DH keys
-        adapter = WeakDHAdapter()
+        # Mount custom adapter for weak DH keys. The pool is sized above the
+        # monitor's worker count so concurrent requests keep their TLS
+        # connections alive instead of discarding them once the pool is full.
+        adapter = WeakDHAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, connect=2, read=2, backoff_factor=0.3,
+                              status_forcelist=[502, 503, 504],
+                              allowed_methods=frozenset(["GET", "HEAD"]))
+        )
         self.session.mount('https://', adapter)
         self.session.mount('http://', adapter)
 
         self.session.headers.update({
             'Content-Type': 'application/json',
             'Accept': 'application/json',
-            'OData-Version': '4.0'
+            'OData-Version': '4.0',
+            'Connection': 'keep-alive'
         })
 
+        # GET response cache: {endpoint: (expiry_monotonic, etag, payload)}
+        self._cache: Dict[str, tuple] = {}
+        self._cache_lock = threading.Lock()
+        self._fetch_locks: Dict[str, threading.Lock] = {}
+        # Endpoints the iDRAC answered with 400/501, i.e. requests this firmware does not implement
+        self._unsupported_endpoints: set = set()
+
+        # Whether the iDRAC honours $expand on the Storage collection (None = not probed yet)
+        self.supports_expand: Optional[bool] = None
+
         # Test connection and get service root
         self._test_connection()
 
     def _test_connection(self):
         """Test connection to iDRAC and verify Redfish service is available"""
         try:
-            response = self.session.get(f"{self.base_url}/redfish/v1", timeout=10)
+            response = self.session.get(f"{self.base_url}/redfish/v1", timeout=self.timeout)
             if response.status_code != 200:
-                print(f"Warning: Unable to connect to iDRAC at {self.idrac_ip}")
-                print(f"Status Code: {response.status_code}")
+                logger.warning("Unable to connect to iDRAC at %s, status code %s",
+                               self.idrac_ip, response.status_code)
         except Exception as e:
-            print(f"Warning: Connection test failed: {str(e)}")
+            logger.warning("Connection test failed: %s", e)
 
-    def _make_request(self, endpoint: str, method: str = "GET", data: dict = None) -> Optional[Dict]:
-        """Make HTTP request to iDRAC Redfish API"""
+    def logout(self):
+        """No-op: basic auth opens no Redfish session, so there is nothing to delete"""
+        pass
+
+    def invalidate(self, endpoint: Optional[str] = None):
+        """Drop a cached response, or the whole cache when no endpoint is given"""
+        with self._cache_lock:
+            if endpoint is None:
+                self._cache.clear()
+            else:
+                self._cache.pop(endpoint, None)
+
+    def _make_request(self, endpoint: str, method: str = "GET", data: dict = None,
+                      cache_ttl: float = 0) -> Optional[Dict]:
+        """Make HTTP request to iDRAC Redfish API, serving GETs from cache for cache_ttl seconds"""
         # Ensure endpoint starts with /redfish/v1 if not already
         if not endpoint.startswith('/redfish/v1'):
             endpoint = f"/redfish/v1{endpoint}"
 
         url = f"{self.base_url}{endpoint}"
+        assert "X-Auth-Token" not in self.session.headers, "Redfish session tokens are not used, see class docstring"
+
+        if method != "GET":
+            # Modifying a resource makes any cached copy of it stale
+            self.invalidate(endpoint)
+            response = self._send_request(url, method, data)
+            return self._parse_response(url, response) if response is not None else None
+
+        with self._cache_lock:
+            entry = self._cache.get(endpoint)
+            fetch_lock = self._fetch_locks.setdefault(endpoint, threading.Lock())
+        if entry and entry[0] > time.monotonic():
+            return entry[2]
+
+        # Concurrent misses on the same endpoint (e.g. the disk and volume stages both
+        # walking the controllers) wait for a single request instead of each sending one
+        with fetch_lock:
+            with self._cache_lock:
+                entry = self._cache.get(endpoint)
+            if entry and entry[0] > time.monotonic():
+                return entry[2]
+            return self._fetch(endpoint, url, entry, cache_ttl)
+
+    def _fetch(self, endpoint: str, url: str, entry: Optional[tuple], cache_ttl: float) -> Optional[Dict]:
+        """GET an endpoint and store the result, revalidating an expired cache entry"""
+        # Revalidate an expired entry with its ETag; an unchanged resource answers 304 without a body
+        headers = {"If-None-Match": entry[1]} if entry and entry[1] else None
+        response = self._send_request(url, "GET", headers=headers)
+        if response is None:
+            return None
+
+        if response.status_code == 304 and entry:
+            with self._cache_lock:
+                self._cache[endpoint] = (time.monotonic() + cache_ttl, entry[1], entry[2])
+            return entry[2]
+
+        if response.status_code in (400, 501):
+            self._unsupported_endpoints.add(endpoint)
 
+        result = self._parse_response(url, response)
+        etag = response.headers.get("ETag")
+        if result is not None and (cache_ttl > 0 or etag):
+            with self._cache_lock:
+                self._cache[endpoint] = (time.monotonic() + cache_ttl, etag, result)
+
+        return result
+
+    def _send_request(self, url: str, method: str, data: dict = None,
+                      headers: Optional[Dict] = None) -> Optional[requests.Response]:
+        """Send HTTP request to iDRAC Redfish API, returning None if it could not be completed"""
         try:
             if method == "GET":
-                response = self.session.get(url, timeout=30)
+                return self.session.get(url, headers=headers, timeout=self.timeout)
             elif method == "POST":
-                response = self.session.post(url, json=data, timeout=30)
+                return self.session.post(url, json=data, timeout=self.timeout)
             elif method == "PATCH":
-                response = self.session.patch(url, json=data, timeout=30)
+                return self.session.patch(url, json=data, timeout=self.timeout)
             elif method == "DELETE":
-                response = self.session.delete(url, timeout=30)
+                return self.session.delete(url, timeout=self.timeout)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
 
-            if response.status_code in [200, 201, 202, 204]:
-                if response.text:
-                    try:
-                        return response.json()
-                    except json.JSONDecodeError:
-                        return {"status": "success", "text": response.text}
-                else:
-                    return {"status": "success"}
-            elif response.status_code == 404:
-                # Don't print for 404 errors, they might be expected
-                return None
-            else:
-                print(f"HTTP Error {response.status_code} for {url}")
-                if response.text:
-                    print(f"Response: {response.text[:500]}")
-                return None
-
         except requests.exceptions.SSLError as e:
-            print(f"SSL Error for {url}: {str(e)}")
-            print("Try updating iDRAC firmware or check SSL settings")
+            logger.error("SSL Error for %s: %s (try updating iDRAC firmware or check SSL settings)", url, e)
             return None
         except requests.exceptions.Timeout:
-            print(f"Request timeout for {url}")
+            logger.warning("Request timeout for %s", url)
             return None
         except requests.exceptions.RequestException as e:
-            print(f"Request failed for {url}: {str(e)}")
+            logger.warning("Request failed for %s: %s", url, e)
+            return None
+
+    def _parse_response(self, url: str, response: requests.Response) -> Optional[Dict]:
+        """Decode a Redfish response body, or None for error responses"""
+        if response.status_code in [200, 201, 202, 204]:
+            if response.content:
+                try:
+                    return _json_loads(response.content)
+                except json.JSONDecodeError:  # orjson.JSONDecodeError subclasses it
+                    return {"status": "success", "text": response.text}
+            else:
+                return {"status": "success"}
+        elif response.status_code == 404:
+            # Don't print for 404 errors, they might be expected
+            return None
+        else:
+            logger.warning("HTTP Error %s for %s", response.status_code, url)
+            # Only decode the body when someone is going to read it
+            if logger.isEnabledFor(logging.DEBUG) and response.content:
+                logger.debug("Response: %s", response.text[:500])
             return None
 
     def get_system_info(self) -> Optional[Dict]:
         """Get basic system information"""
-        return self._make_request("/redfish/v1/Systems/System.Embedded.1")
+        return self._make_request("/redfish/v1/Systems/System.Embedded.1",
+                                  cache_ttl=self.CACHE_TTL["system_info"])
 
     def get_storage_controllers(self) -> Optional[Dict]:
         """Get storage controllers information"""
         # Try both possible endpoints
-        result = self._make_request("/redfish/v1/Systems/System.Embedded.1/Storage")
+        ttl = self.CACHE_TTL["storage_collections"]
+        result = self._make_request("/redfish/v1/Systems/System.Embedded.1/Storage", cache_ttl=ttl)
         if not result:
             # Try alternative endpoint for older iDRAC versions
-            result = self._make_request("/redfish/v1/Systems/System.Embedded.1/SimpleStorage")
+            result = self._make_request("/redfish/v1/Systems/System.Embedded.1/SimpleStorage", cache_ttl=ttl)
         return result
 
+    def get_storage_tree(self) -> Optional[Dict]:
+        """Get storage controllers with their drives and volumes inlined via $expand"""
+        if self.supports_expand is False:
+            return None
+
+        endpoint = "/redfish/v1/Systems/System.Embedded.1/Storage?$expand=*($levels=2)"
+        result = self._make_request(endpoint, cache_ttl=self.CACHE_TTL["storage_controllers"])
+        if result is None:
+            # Older firmware rejects $expand (400/501): remember that and use per-resource GETs.
+            # Timeouts and 5xx may be transient, so leave it unknown and probe again next refresh
+            if endpoint in self._unsupported_endpoints:
+                self.supports_expand = False
+            return None
+
+        # Some firmware silently ignores $expand and returns bare references
+        members = result.get("Members", [])
+        if members:
+            self.supports_expand = all(any(key != "@odata.id" for key in member) for member in members)
+        return result if self.supports_expand else None
+
     def get_storage_controller_details(self, controller_id: str) -> Optional[Dict]:
         """Get detailed information about a specific storage controller"""
-        return self._make_request(f"/redfish/v1/Systems/System.Embedded.1/Storage/{controller_id}")
+        return self._make_request(f"/redfish/v1/Systems/System.Embedded.1/Storage/{controller_id}",
+                                  cache_ttl=self.CACHE_TTL["storage_controllers"])
 
-    def get_physical_disks(self, controller_id: str) -> Optional[Dict]:
-        """Get physical disks for a storage controller"""
+    def get_physical_disks(self, controller_id: str, controller_details: Optional[Dict] = None) -> Optional[Dict]:
+        """Get physical disks for a storage controller, reusing controller_details when the caller has them"""
         # First try to get controller details which might contain drives
-        controller_details = self.get_storage_controller_details(controller_id)
+        if controller_details is None:
+            controller_details = self.get_storage_controller_details(controller_id)
         if controller_details and "Drives" in controller_details:
             # Return the drives from controller details
             return {"Members": controller_details["Drives"]}
 
         # Otherwise try the Drives endpoint
-        return self._make_request(f"/redfish/v1/Systems/System.Embedded.1/Storage/{controller_id}/Drives")
+        return self._make_request(f"/redfish/v1/Systems/System.Embedded.1/Storage/{controller_id}/Drives",
+                                  cache_ttl=self.CACHE_TTL["storage_collections"])
 
     def get_physical_disk_details(self, disk_odata_id: str) -> Optional[Dict]:
         """Get detailed information about a specific physical disk"""
         # disk_odata_id should be the full @odata.id path
+        ttl = self.CACHE_TTL["drive_details"]
         if disk_odata_id.startswith('/'):
-            return self._make_request(disk_odata_id)
+            return self._make_request(disk_odata_id, cache_ttl=ttl)
         else:
-            return self._make_request(f"/redfish/v1/Chassis/System.Embedded.1/Drives/{disk_odata_id}")
+            return self._make_request(f"/redfish/v1/Chassis/System.Embedded.1/Drives/{disk_odata_id}", cache_ttl=ttl)
 
-    def get_virtual_disks(self, controller_id: str) -> Optional[Dict]:
-        """Get virtual disks for a storage controller"""
+    def get_virtual_disks(self, controller_id: str, controller_details: Optional[Dict] = None) -> Optional[Dict]:
+        """Get virtual disks for a storage controller, reusing controller_details when the caller has them"""
         # First try to get controller details which might contain volumes
-        controller_details = self.get_storage_controller_details(controller_id)
+        if controller_details is None:
+            controller_details = self.get_storage_controller_details(controller_id)
         if controller_details and "Volumes" in controller_details:
             # Get the volumes collection
             volumes_link = controller_details["Volumes"].get("@odata.id")
             if volumes_link:
-                return self._make_request(volumes_link)
+                return self._make_request(volumes_link, cache_ttl=self.CACHE_TTL["storage_collections"])
 
         # Otherwise try the Volumes endpoint directly
-        return self._make_request(f"/redfish/v1/Systems/System.Embedded.1/Storage/{controller_id}/Volumes")
+        return self._make_request(f"/redfish/v1/Systems/System.Embedded.1/Storage/{controller_id}/Volumes",
+                                  cache_ttl=self.CACHE_TTL["storage_collections"])
 
     def get_virtual_disk_details(self, volume_odata_id: str) -> Optional[Dict]:
         """Get detailed information about a specific virtual disk"""
         # If it's a full path, use it directly
         if volume_odata_id.startswith('/'):
-            return self._make_request(volume_odata_id)
+            return self._make_request(volume_odata_id, cache_ttl=self.CACHE_TTL["drive_details"])
         # Otherwise construct the path
         return None
 
-    def get_sel_logs(self) -> Optional[Dict]:
-        """Get System Event Log entries"""
-        return self._make_request("/redfish/v1/Managers/iDRAC.Embedded.1/Logs/Sel",method="GET")
-
-    def get_lc_logs(self) -> Optional[Dict]:
-        """Get Lifecycle Controller log entries"""
-        return self._make_request("/redfish/v1/Managers/iDRAC.Embedded.1/Logs/Lclog",method="GET")
+    def get_sel_logs(self, top: Optional[int] = None) -> Optional[Dict]:
+        """Get System Event Log entries, newest first, optionally limited server-side with $top"""
+        return self._get_log("/redfish/v1/Managers/iDRAC.Embedded.1/Logs/Sel", top, orderby="Created desc")
+
+    def get_lc_logs(self, top: Optional[int] = None) -> Optional[Dict]:
+        """Get Lifecycle Controller log entries, optionally limited server-side with $top"""
+        return self._get_log("/redfish/v1/Managers/iDRAC.Embedded.1/Logs/Lclog", top)
+
+    def _get_log(self, endpoint: str, top: Optional[int] = None, orderby: Optional[str] = None) -> Optional[Dict]:
+        """Get a log collection, applying $top / $orderby when given and falling back to the full log"""
+        ttl = self.CACHE_TTL["sel_logs"]
+
+        query = []
+        if top:
+            # $top alone keeps whatever order the iDRAC lists entries in, so ask for the order explicitly
+            if orderby:
+                query.append("$orderby=" + quote(orderby))
+            query.append(f"$top={top}")
+
+        query_endpoint = f"{endpoint}?{'&'.join(query)}" if query else None
+        # Once the iDRAC has rejected the query options, go straight to the full log on later refreshes
+        if query_endpoint and query_endpoint not in self._unsupported_endpoints:
+            result = self._make_request(query_endpoint, method="GET", cache_ttl=ttl)
+            if result is not None:
+                return result
+            # The iDRAC rejected the query options, fall back to the full log
+
+        return self._make_request(endpoint, method="GET", cache_ttl=ttl)
+
+
+@dataclass(slots=True, frozen=True)
+class DiskInfo:
+    """Physical disk record, field names match the JSON returned by the API"""
+    id: str
+    name: str
+    status: str
+    size: str
+    interface: str
+    model: str
+    serialNumber: str
+    manufacturer: str
+    mediaType: str
+    location: str
+    temperature: Any
+    powerOnHours: Any
+    predictiveFailure: Any
+    lastUpdated: str
+
+
+@dataclass(slots=True, frozen=True)
+class VirtualDiskInfo:
+    """Virtual disk / RAID array record, field names match the JSON returned by the API"""
+    id: str
+    name: str
+    status: str
+    size: str
+    raidLevel: str
+    encrypted: Any
+    optimumIOSize: Any
+    blockSizeBytes: Any
+    drivesInfo: str
+    drivesCount: str
+    lastUpdated: str
+
+
+@dataclass(slots=True, frozen=True)
+class AlertInfo:
+    """System alert record, field names match the JSON returned by the API"""
+    id: str
+    message: str
+    severity: str
+    timestamp: str
+    messageId: str
+    entryType: str
+    sensorType: str = ""
+    sensorNumber: Any = 0
+    acknowledged: bool = False
 
 
 class IDRACHardwareMonitor:
@@ -190,8 +461,11 @@ class IDRACHardwareMonitor:
     Hardware monitoring service that processes iDRAC data
     """
 
-    def __init__(self, idrac_client: IDRACRedfishClient):
+    def __init__(self, idrac_client: IDRACRedfishClient, max_workers: int = 4):
         self.client = idrac_client
+        # Upper bound on concurrent disk/volume requests issued against the iDRAC.
+        # Kept small and shared by both disk stages so the BMC is not overwhelmed.
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="idrac-redfish")
 
     # 提取磁盘编号的函数
     def extract_disk_numbers(self,drives):
@@ -209,26 +483,19 @@ class IDRACHardwareMonitor:
         if not redfish_status:
             return "unknown"
 
-        state = str(redfish_status.get("State", "")).lower()
-        health = str(redfish_status.get("Health", "")).lower()
-        health_rollup = str(redfish_status.get("HealthRollup", "")).lower()
-
-        # Check health first (most important)
-        if health == "critical" or health_rollup == "critical":
-            return "critical"
-        elif health == "warning" or health_rollup == "warning":
-            return "warning"
-        elif health == "ok" or health_rollup == "ok":
-            if state == "enabled":
-                return "healthy"
-            elif state == "standbyspare":
-                return "standby"
-            else:
-                return "healthy"
-        elif state == "absent" or state == "unavailableoffline":
-            return "offline"
-        else:
-            return "unknown"
+        # Redfish sends null for unknown health, so fall back to "" rather than str()
+        state = (redfish_status.get("State") or "").lower()
+        health = (redfish_status.get("Health") or "").lower()
+        health_rollup = (redfish_status.get("HealthRollup") or "").lower()
+
+        # Check health first (most important): the worse of Health and HealthRollup wins
+        if _HEALTH_RANK.get(health_rollup, _UNRANKED) < _HEALTH_RANK.get(health, _UNRANKED):
+            health = health_rollup
+
+        return (_STATUS_TABLE.get((state, health))
+                or _STATUS_TABLE.get((_ANY, health))
+                or _STATUS_TABLE.get((state, _ANY))
+                or "unknown")
 
     def _convert_bytes_to_gb(self, size_bytes: Any) -> float:
         """Convert bytes to GB"""
@@ -240,192 +507,209 @@ class IDRACHardwareMonitor:
         except (ValueError, TypeError):
             return 0.0
 
-    def _extract_disk_metrics(self, disk_data: dict) -> dict:
-        """Extract key metrics from disk data"""
-        metrics = {}
-
-        # Extract temperature and other metrics
-        if "Oem" in disk_data and "Dell" in disk_data["Oem"]:
-            dell_data = disk_data["Oem"]["Dell"]
-            if "DellPhysicalDisk" in dell_data:
-                disk_info = dell_data["DellPhysicalDisk"]
-                metrics["temperature"] = disk_info.get("Temperature")
-                metrics["powerOnHours"] = disk_info.get("PowerOnHours")
-                metrics["predictiveFailure"] = disk_info.get("PredictedMediaLifeLeftPercent")
-                metrics["operationPercentComplete"] = disk_info.get("OperationPercentComplete")
-
-        # Try to get metrics from standard fields
-        if "Temperature" in disk_data:
-            temp_data = disk_data["Temperature"]
-            if isinstance(temp_data, dict):
-                metrics["temperature"] = temp_data.get("ReadingCelsius")
-
-        if "PredictedMediaLifeLeftPercent" in disk_data:
-            metrics["predictiveFailure"] = disk_data["PredictedMediaLifeLeftPercent"]
-
-        return metrics
-
-    def get_physical_disks_status(self) -> List[Dict]:
-        """Get status of all physical disks"""
-        physical_disks = []
+    def _build_disk_info(self, disk_odata_id: str, disk_details: dict, now_iso: str) -> DiskInfo:
+        """Convert Redfish drive details to our physical disk record in a single pass"""
+        g = disk_details.get
+
+        # Extract disk information
+        status = self._normalize_status(g("Status", {}))
+        size_gb = self._convert_bytes_to_gb(g("CapacityBytes", 0))
+
+        # Extract temperature and other metrics from the Dell OEM data
+        dell_disk = ((g("Oem") or {}).get("Dell") or {}).get("DellPhysicalDisk")
+        if dell_disk is not None:
+            temperature = dell_disk.get("Temperature")
+            power_on_hours = dell_disk.get("PowerOnHours")
+            predictive_failure = dell_disk.get("PredictedMediaLifeLeftPercent")
+        else:
+            temperature = power_on_hours = predictive_failure = "N/A"
+
+        # Standard fields take precedence over the OEM data
+        temp_data = g("Temperature")
+        if isinstance(temp_data, dict):
+            temperature = temp_data.get("ReadingCelsius")
+        if "PredictedMediaLifeLeftPercent" in disk_details:
+            predictive_failure = disk_details["PredictedMediaLifeLeftPercent"]
+
+        # Get location info
+        loc = g("PhysicalLocation") or {}
+        part = loc.get("PartLocation") or {}
+        location = part.get("ServiceLabel", "Unknown")
+
+        return DiskInfo(
+            id=g("Id") or disk_odata_id.rpartition("/")[2],
+            status=status,
+            size=f"{size_gb} GB",
+            location=location,
+            temperature=temperature,
+            powerOnHours=power_on_hours,
+            predictiveFailure=predictive_failure,
+            lastUpdated=now_iso,
+            **_fields_from_map(disk_details, _DISK_FIELD_MAP)
+        )
+
+    def _build_virtual_disk_info(self, volume_odata_id: str, volume_details: dict, now_iso: str) -> VirtualDiskInfo:
+        """Convert Redfish volume details to our virtual disk record"""
+        # Extract volume information
+        status = self._normalize_status(volume_details.get("Status", {}))
+        size_gb = self._convert_bytes_to_gb(volume_details.get("CapacityBytes", 0))
+
+        # Extract RAID level
+        raid_type = volume_details.get("RAIDType", "Unknown")
+        if raid_type == "Unknown" and "VolumeType" in volume_details:
+            raid_type = volume_details["VolumeType"]
+
+        # Try to get from OEM data if not found
+        if raid_type == "Unknown" and "Oem" in volume_details and "Dell" in volume_details["Oem"]:
+            dell_data = volume_details["Oem"]["Dell"]
+            if "DellVirtualDisk" in dell_data:
+                raid_type = dell_data["DellVirtualDisk"].get("RAIDType", "Unknown")
+        disk_numbers = self.extract_disk_numbers(volume_details['Links']['Drives'])
+
+        return VirtualDiskInfo(
+            id=volume_details.get("Id", volume_odata_id.rpartition("/")[2]),
+            status=status,
+            size=f"{size_gb} GB",
+            raidLevel=raid_type,
+            drivesInfo='/'.join(map(str, disk_numbers)),
+            drivesCount=str(volume_details['Links']['Drives@odata.count']),
+            lastUpdated=now_iso,
+            **_fields_from_map(volume_details, _VIRTUAL_DISK_FIELD_MAP)
+        )
+
+    def _is_expanded(self, resource: Any) -> bool:
+        """Check whether a Redfish reference carries the resource itself (inlined by $expand)"""
+        return isinstance(resource, dict) and any(key != "@odata.id" for key in resource)
+
+    def _get_controllers(self) -> List[tuple]:
+        """Get (controller_id, controller_details) pairs, details are None unless $expand worked"""
+        storage_tree = self.client.get_storage_tree()
+        if storage_tree:
+            return [(member["@odata.id"].rpartition("/")[2], member) for member in storage_tree["Members"]]
 
-        # Get storage controllers
         controllers_data = self.client.get_storage_controllers()
         if not controllers_data or "Members" not in controllers_data:
-            print("No storage controllers found")
-            return physical_disks
+            return []
+        return [(ref["@odata.id"].rpartition("/")[2], None) for ref in controllers_data["Members"]]
+
+    def _get_controller_drives(self, controller_id: str, controller_details: Optional[Dict] = None) -> List[Dict]:
+        """Get the drive references (or inlined drives) attached to a storage controller"""
+        # Get controller details to find drives
+        if controller_details is None:
+            controller_details = self.client.get_storage_controller_details(controller_id)
+        if not controller_details:
+            return []
+
+        # Get drives from controller
+        drives = controller_details.get("Drives", [])
+        if not drives:
+            # Try getting physical disks directly
+            disks_data = self.client.get_physical_disks(controller_id, controller_details)
+            if disks_data and "Members" in disks_data:
+                drives = disks_data["Members"]
 
-        for controller_ref in controllers_data["Members"]:
-            controller_id = controller_ref["@odata.id"].split("/")[-1]
+        return [drive for drive in drives if isinstance(drive, dict) and "@odata.id" in drive]
 
-            # Get controller details to find drives
+    def _get_controller_volumes(self, controller_id: str, controller_details: Optional[Dict] = None) -> List[Dict]:
+        """Get the volume references (or inlined volumes) defined on a storage controller"""
+        logger.debug("Checking controller: %s", controller_id)
+
+        # Get controller details first
+        if controller_details is None:
             controller_details = self.client.get_storage_controller_details(controller_id)
-            if not controller_details:
-                continue
+        if not controller_details:
+            return []
+
+        # Check if controller has Volumes link
+        if "Volumes" not in controller_details:
+            logger.debug("Controller %s has no Volumes link", controller_id)
+            return []
+
+        volumes_data = controller_details["Volumes"]
+        if "Members" not in volumes_data:
+            volumes_link = volumes_data.get("@odata.id")
+            if not volumes_link:
+                return []
+
+            logger.debug("Found volumes link: %s", volumes_link)
+            volumes_data = self.client.get_virtual_disks(controller_id, controller_details)
+            if not volumes_data or "Members" not in volumes_data:
+                logger.debug("No volumes found in response")
+                return []
+
+        logger.debug("Found %d volumes", len(volumes_data["Members"]))
+        return [volume for volume in volumes_data["Members"]
+                if isinstance(volume, dict) and volume.get("@odata.id")]
+
+    def get_physical_disks_status(self, now_iso: Optional[str] = None) -> List[DiskInfo]:
+        """Get status of all physical disks, stamped with now_iso (defaults to the current time)"""
+        physical_disks = []
+        now_iso = now_iso or datetime.now().isoformat()
 
-            # Get drives from controller
-            drives = controller_details.get("Drives", [])
-            if not drives:
-                # Try getting physical disks directly
-                disks_data = self.client.get_physical_disks(controller_id)
-                if disks_data and "Members" in disks_data:
-                    drives = disks_data["Members"]
-
-            for drive_ref in drives:
-                if isinstance(drive_ref, dict) and "@odata.id" in drive_ref:
-                    disk_odata_id = drive_ref["@odata.id"]
-                else:
-                    continue
-
-                # Get detailed disk information
-                disk_details = self.client.get_physical_disk_details(disk_odata_id)
-                if not disk_details:
-                    continue
-                # print("Disk details:", disk_details)
-                # Extract disk information
-                status = self._normalize_status(disk_details.get("Status", {}))
-                size_gb = self._convert_bytes_to_gb(disk_details.get("CapacityBytes", 0))
-                metrics = self._extract_disk_metrics(disk_details)
-
-                # Get location info
-                location = "Unknown"
-                if "PhysicalLocation" in disk_details:
-                    loc = disk_details["PhysicalLocation"]
-                    if "PartLocation" in loc:
-                        location = loc["PartLocation"].get("ServiceLabel", "Unknown")
-
-                disk_info = {
-                    "id": disk_details.get("Id", disk_odata_id.split("/")[-1]),
-                    "name": disk_details.get("Name", "Unknown"),
-                    "status": status,
-                    "size": f"{size_gb} GB",
-                    "interface": disk_details.get("Protocol", "Unknown"),
-                    "model": disk_details.get("Model", "Unknown"),
-                    "serialNumber": disk_details.get("SerialNumber", "Unknown"),
-                    "manufacturer": disk_details.get("Manufacturer", "Unknown"),
-                    "mediaType": disk_details.get("MediaType", "Unknown"),
-                    "location": location,
-                    "temperature": metrics.get("temperature", "N/A"),
-                    "powerOnHours": metrics.get("powerOnHours", "N/A"),
-                    "predictiveFailure": metrics.get("predictiveFailure", "N/A"),
-                    "lastUpdated": datetime.now().isoformat()
-                }
+        # Get storage controllers
+        controllers = self._get_controllers()
+        if not controllers:
+            logger.info("No storage controllers found")
+            return physical_disks
 
-                physical_disks.append(disk_info)
+        # First wave: resolve the drives of every controller
+        drives = [drive
+                  for controller_drives in self._executor.map(self._get_controller_drives, *zip(*controllers))
+                  for drive in controller_drives]
+
+        # Second wave: get detailed disk information for drives not inlined by $expand
+        pending_ids = [drive["@odata.id"] for drive in drives if not self._is_expanded(drive)]
+        fetched = dict(zip(pending_ids, self._executor.map(self.client.get_physical_disk_details, pending_ids)))
+
+        for drive in drives:
+            disk_odata_id = drive["@odata.id"]
+            disk_details = drive if self._is_expanded(drive) else fetched.get(disk_odata_id)
+            if not disk_details:
+                continue
+            physical_disks.append(self._build_disk_info(disk_odata_id, disk_details, now_iso))
 
         return physical_disks
 
-    def get_virtual_disks_status(self) -> List[Dict]:
-        """Get status of all virtual disks/RAID arrays"""
+    def get_virtual_disks_status(self, now_iso: Optional[str] = None) -> List[VirtualDiskInfo]:
+        """Get status of all virtual disks/RAID arrays, stamped with now_iso (defaults to the current time)"""
         virtual_disks = []
+        now_iso = now_iso or datetime.now().isoformat()
 
         # Get storage controllers
-        controllers_data = self.client.get_storage_controllers()
-        if not controllers_data or "Members" not in controllers_data:
-            print("No storage controllers found")
+        controllers = self._get_controllers()
+        if not controllers:
+            logger.info("No storage controllers found")
             return virtual_disks
 
-        for controller_ref in controllers_data["Members"]:
-            controller_id = controller_ref["@odata.id"].split("/")[-1]
-            print(f"Checking controller: {controller_id}")
+        # First wave: resolve the volumes of every controller
+        volumes = [volume
+                   for controller_volumes in self._executor.map(self._get_controller_volumes, *zip(*controllers))
+                   for volume in controller_volumes]
 
-            # Get controller details first
-            controller_details = self.client.get_storage_controller_details(controller_id)
-            if not controller_details:
-                continue
+        # Second wave: get detailed volume information for volumes not inlined by $expand
+        pending_ids = [volume["@odata.id"] for volume in volumes if not self._is_expanded(volume)]
+        fetched = dict(zip(pending_ids, self._executor.map(self.client.get_virtual_disk_details, pending_ids)))
 
-            # Check if controller has Volumes link
-            if "Volumes" in controller_details:
-                volumes_link = controller_details["Volumes"].get("@odata.id")
-                if volumes_link:
-                    print(f"Found volumes link: {volumes_link}")
-                    volumes_data = self.client._make_request(volumes_link)
-
-                    if volumes_data and "Members" in volumes_data:
-                        print(f"Found {len(volumes_data['Members'])} volumes")
-
-                        for volume_ref in volumes_data["Members"]:
-                            volume_odata_id = volume_ref.get("@odata.id")
-                            if not volume_odata_id:
-                                continue
-
-                            print(f"Getting volume details from: {volume_odata_id}")
-                            # Get detailed volume information using the full path
-                            volume_details = self.client.get_virtual_disk_details(volume_odata_id)
-                            if not volume_details:
-                                continue
-
-                            # print(f"Volume details: {volume_details}")
-
-                            # Extract volume information
-                            status = self._normalize_status(volume_details.get("Status", {}))
-                            size_gb = self._convert_bytes_to_gb(volume_details.get("CapacityBytes", 0))
-
-                            # Extract RAID level
-                            raid_type = volume_details.get("RAIDType", "Unknown")
-                            if raid_type == "Unknown" and "VolumeType" in volume_details:
-                                raid_type = volume_details["VolumeType"]
-
-                            # Try to get from OEM data if not found
-                            if raid_type == "Unknown" and "Oem" in volume_details and "Dell" in volume_details["Oem"]:
-                                dell_data = volume_details["Oem"]["Dell"]
-                                if "DellVirtualDisk" in dell_data:
-                                    raid_type = dell_data["DellVirtualDisk"].get("RAIDType", "Unknown")
-                            disk_numbers = self.extract_disk_numbers(volume_details['Links']['Drives'])
-
-                            virtual_disk_info = {
-                                "id": volume_details.get("Id", volume_odata_id.split("/")[-1]),
-                                "name": volume_details.get("Name", "Unknown"),
-                                "status": status,
-                                "size": f"{size_gb} GB",
-                                "raidLevel": raid_type,
-                                "encrypted": volume_details.get("Encrypted", False),
-                                "optimumIOSize": volume_details.get("OptimumIOSizeBytes", "N/A"),
-                                "blockSizeBytes": volume_details.get("BlockSizeBytes", "N/A"),
-                                "drivesInfo": '/'.join(map(str, disk_numbers)),
-                                "drivesCount": str(volume_details['Links']['Drives@odata.count']),
-                                "lastUpdated": datetime.now().isoformat()
-                            }
-
-                            virtual_disks.append(virtual_disk_info)
-                    else:
-                        print(f"No volumes found in response")
-            else:
-                print(f"Controller {controller_id} has no Volumes link")
+        for volume in volumes:
+            volume_odata_id = volume["@odata.id"]
+            volume_details = volume if self._is_expanded(volume) else fetched.get(volume_odata_id)
+            if not volume_details:
+                continue
+            virtual_disks.append(self._build_virtual_disk_info(volume_odata_id, volume_details, now_iso))
 
         return virtual_disks
 
-    def get_system_alerts(self) -> List[Dict]:
-        """Get system alerts from event logs"""
+    def get_system_alerts(self, now_iso: Optional[str] = None) -> List[AlertInfo]:
+        """Get system alerts from event logs, now_iso is used for entries without a timestamp"""
         alerts = []
+        now_iso = now_iso or datetime.now().isoformat()
 
         try:
             # Get SEL (System Event Log) entries
-            print("Fetching SEL logs...")
-            sel_data = self.client.get_sel_logs()
-            print(sel_data)
+            logger.debug("Fetching SEL logs...")
+            sel_data = self.client.get_sel_logs(top=20)
             if sel_data and "Members" in sel_data:
-                print(f"Found {len(sel_data['Members'])} SEL entries")
+                logger.debug("Found %d SEL entries", len(sel_data["Members"]))
 
                 # Process entries and filter for alerts
                 for entry in sel_data["Members"]:
@@ -434,67 +718,73 @@ class IDRACHardwareMonitor:
 
                     # Include critical, warning, and some informational alerts
                     if severity in ["critical", "warning"] or entry_type == "sel" or entry_type == "alert":
-                        alert = {
-                            "id": entry.get("Id", str(len(alerts))),
-                            "message": entry.get("Message", "Unknown alert"),
-                            "severity": severity if severity else "information",
-                            "timestamp": entry.get("Created", datetime.now().isoformat()),
-                            "messageId": entry.get("MessageId", ""),
-                            "entryType": entry.get("EntryType", "Event"),
-                            "sensorType": entry.get("SensorType", ""),
-                            "sensorNumber": entry.get("SensorNumber", 0),
-                            "acknowledged": False
-                        }
+                        alert = AlertInfo(
+                            id=entry.get("Id", str(len(alerts))),
+                            message=entry.get("Message", "Unknown alert"),
+                            severity=severity if severity else "information",
+                            timestamp=entry.get("Created", now_iso),
+                            messageId=entry.get("MessageId", ""),
+                            entryType=entry.get("EntryType", "Event"),
+                            sensorType=entry.get("SensorType", ""),
+                            sensorNumber=entry.get("SensorNumber", 0)
+                        )
                         alerts.append(alert)
 
-                # Sort by timestamp (newest first) and limit to recent alerts
-                alerts.sort(key=lambda x: x["timestamp"], reverse=True)
-                alerts = alerts[:20]  # Keep last 20 alerts
+                # Keep the 20 most recent alerts (newest first)
+                alerts = heapq.nlargest(20, alerts, key=_alert_timestamp)
 
             else:
-                print("No SEL entries found")
+                logger.debug("No SEL entries found")
 
             # Also try to get LC logs for additional alerts
-            print("Fetching LC logs...")
-            lc_data = self.client.get_lc_logs()
-            print(lc_data)
+            logger.debug("Fetching LC logs...")
+            lc_data = self.client.get_lc_logs(top=10)
             if lc_data and "Members" in lc_data:
-                print(f"Found {len(lc_data['Members'])} LC log entries")
+                logger.debug("Found %d LC log entries", len(lc_data["Members"]))
 
-                for entry in lc_data["Members"][:10]:  # Check last 10 LC logs
+                seen_messages = {a.message for a in alerts}
+                for entry in lc_data["Members"][:10]:  # Check last 10 LC logs ($top may be ignored)
                     severity = str(entry.get("Severity", "")).lower()
                     if severity in ["critical", "warning"]:
                         # Check if this alert is not already in the list
                         message = entry.get("Message", "")
-                        if not any(a["message"] == message for a in alerts):
-                            alert = {
-                                "id": f"LC_{entry.get('Id', len(alerts))}",
-                                "message": message,
-                                "severity": severity,
-                                "timestamp": entry.get("Created", datetime.now().isoformat()),
-                                "messageId": entry.get("MessageId", ""),
-                                "entryType": "LifecycleLog",
-                                "acknowledged": False
-                            }
+                        if message not in seen_messages:
+                            seen_messages.add(message)
+                            alert = AlertInfo(
+                                id=f"LC_{entry.get('Id', len(alerts))}",
+                                message=message,
+                                severity=severity,
+                                timestamp=entry.get("Created", now_iso),
+                                messageId=entry.get("MessageId", ""),
+                                entryType="LifecycleLog"
+                            )
                             alerts.append(alert)
 
         except Exception as e:
-            print(f"Error fetching alerts: {str(e)}")
+            logger.warning("Error fetching alerts: %s", e)
 
-        # Sort final list by timestamp
-        alerts.sort(key=lambda x: x["timestamp"], reverse=True)
-
-        return alerts[:20]  # Return top 20 most recent alerts
+        return heapq.nlargest(20, alerts, key=_alert_timestamp)  # Return top 20 most recent alerts
 
     def get_full_hardware_status(self) -> Dict:
         """Get complete hardware status"""
-        print("=" * 60)
-        print("Starting full hardware status collection...")
+        logger.info("Starting full hardware status collection...")
         start_time = time.time()
-
-        # Get system info
-        print("1. Fetching system information...")
-        system_info = self.client.get_system_info()
+        # One timestamp for every record collected by this refresh
+        now_iso = datetime.now().isoformat()
+
+        # The four collection stages are independent, so run them concurrently.
+        # A dedicated pool is used because the disk stages fan out on their own.
+        logger.debug("Fetching system information, physical disks, virtual disks and alerts...")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            system_info_future = executor.submit(self.client.get_system_info)
+            physical_disks_future = executor.submit(self.get_physical_disks_status, now_iso)
+            virtual_disks_future = executor.submit(self.get_virtual_disks_status, now_iso)
+            alerts_future = executor.submit(self.get_system_alerts, now_iso)
+
+            system_info = system_info_future.result()
+            physical_disks = physical_disks_future.result()
+            virtual_disks = virtual_disks_future.result()
+            alerts = alerts_future.result()
 
         # Extract system info safely
         server_info = {
@@ -506,23 +796,12 @@ class IDRACHardwareMonitor:
             "biosVersion": "Unknown",
             "processorSummary": {},
             "memorySummary": {},
-            "lastUpdated": datetime.now().isoformat()
+            "lastUpdated": now_iso
         }
 
         if system_info:
-            server_info.update({
-                "name": system_info.get("Name", "Unknown"),
-                "model": system_info.get("Model", "Unknown"),
-                "manufacturer": system_info.get("Manufacturer", "Unknown"),
-                "serialNumber": system_info.get("SerialNumber", "Unknown"),
-                "powerState": system_info.get("PowerState", "Unknown"),
-                "biosVersion": system_info.get("BiosVersion", "Unknown"),
-                "systemType": system_info.get("SystemType", "Physical"),
-                "uuid": system_info.get("UUID", ""),
-                "hostName": system_info.get("HostName", ""),
-                "indicatorLED": system_info.get("IndicatorLED", ""),
-                "status": self._normalize_status(system_info.get("Status", {}))
-            })
+            server_info.update(_fields_from_map(system_info, _SERVER_FIELD_MAP))
+            server_info["status"] = self._normalize_status(system_info.get("Status", {}))
 
             # Add processor summary
             if "ProcessorSummary" in system_info:
@@ -542,21 +821,8 @@ class IDRACHardwareMonitor:
                     "status": self._normalize_status(mem_summary.get("Status", {}))
                 }
 
-        # Get physical disks
-        print("2. Fetching physical disk information...")
-        physical_disks = self.get_physical_disks_status()
-
-        # Get virtual disks
-        print("3. Fetching virtual disk information...")
-        virtual_disks = self.get_virtual_disks_status()
-
-        # Get alerts
-        print("4. Fetching system alerts...")
-        alerts = self.get_system_alerts()
-
         elapsed_time = round(time.time() - start_time, 2)
-        print(f"Hardware status collection completed in {elapsed_time}s")
-        print("=" * 60)
+        logger.info("Hardware status collection completed in %ss", elapsed_time)
 
         return {
             "serverInfo": server_info,
@@ -575,6 +841,8 @@ if __name__ == "__main__":
     USERNAME = "root"
     PASSWORD = "111111"
 
+    logging.basicConfig(level=logging.INFO)
+
     try:
         print(f"Connecting to iDRAC at {IDRAC_IP}...")
         client = IDRACRedfishClient(IDRAC_IP, USERNAME, PASSWORD)
@@ -590,15 +858,15 @@ if __name__ == "__main__":
 
         print(f"\n=== Physical Disks ({len(status['physicalDisks'])}) ===")
         for disk in status["physicalDisks"]:
-            print(f"- {disk['name']}: {disk['status']} ({disk['size']}) - {disk['location']}")
+            print(f"- {disk.name}: {disk.status} ({disk.size}) - {disk.location}")
 
         print(f"\n=== Virtual Disks ({len(status['virtualDisks'])}) ===")
         for vdisk in status["virtualDisks"]:
-            print(f"- {vdisk['name']}: {vdisk['status']} ({vdisk['size']}) - RAID: {vdisk['raidLevel']}")
+            print(f"- {vdisk.name}: {vdisk.status} ({vdisk.size}) - RAID: {vdisk.raidLevel}")
 
         print(f"\n=== Alerts ({len(status['alerts'])}) ===")
         for alert in status["alerts"][:5]:  # Show first 5 alerts
-            print(f"- [{alert['severity'].upper()}] {alert['message']} - {alert['timestamp']}")
+            print(f"- [{alert.severity.upper()}] {alert.message} - {alert.timestamp}")
 
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -1,38 +1,62 @@
 from fastapi import FastAPI, HTTPException, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 import asyncio
+import contextlib
+import logging
 import threading
 import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Any
-import json
+import orjson
+import random
 import traceback
 import concurrent.futures
 
-from config import Config
+from config import get_settings
 from idrac_client import IDRACRedfishClient, IDRACHardwareMonitor
 
+settings = get_settings()
+
+# uvicorn only configures its own loggers, route the iDRAC client's INFO lines to stderr too
+logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
 # Global variables for caching data
 cached_hardware_data: Optional[Dict] = None
+cached_blobs: Dict[str, bytes] = {}  # Response bodies serialized once per refresh, keyed by endpoint
+cached_size_bytes = 0  # Serialized size of cached_hardware_data, measured once per refresh
+cached_counts: Dict[str, int] = {"physical": 0, "virtual": 0, "alerts": 0}  # List lengths, counted once per refresh
 last_update_time: Optional[datetime] = None
-monitoring_thread: Optional[threading.Thread] = None
+last_update_iso: Optional[str] = None  # last_update_time.isoformat(), formatted once per refresh
+last_update_monotonic: Optional[float] = None  # time.monotonic() at the last refresh, for cache age
+monitoring_task: Optional[asyncio.Task] = None
+stop_monitoring: Optional[asyncio.Event] = None  # Created on the server's event loop at startup
 is_monitoring = False
-update_lock = threading.Lock()
+update_lock = threading.Lock()  # Held for the whole of a refresh, see update_hardware_data
+last_refresh_ok = False  # Outcome of the latest refresh, shared with callers that waited on it
 initialization_complete = threading.Event()
 initial_data_fetched = threading.Event()
+# asyncio mirrors of the two startup events, woken from executor threads through server_loop
+server_loop: Optional[asyncio.AbstractEventLoop] = None
+initialization_ready: Optional[asyncio.Event] = None
+initial_data_ready: Optional[asyncio.Event] = None
+
+# Shared pool for blocking iDRAC work (startup, refreshes), also caps concurrent fetches
+EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="idrac")
+refresh_in_flight = threading.Event()  # Set while a request-triggered background refresh runs
 
 # Initialize FastAPI app
 app = FastAPI(
     title="iDRAC8 Hardware Monitor API",
     description="RESTful API for monitoring Dell server hardware via iDRAC8 Redfish interface",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse  # Plain dict returns are encoded with orjson too
 )
 
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=Config.ALLOWED_ORIGINS,
+    allow_origins=settings.ALLOWED_ORIGINS,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
@@ -43,21 +67,97 @@ idrac_client = None
 hardware_monitor = None
 
 
+def cache_hardware_data(data: Dict):
+    """Store freshly fetched hardware data, must be called with update_lock held"""
+    global cached_hardware_data, cached_blobs, cached_size_bytes, cached_counts, last_refresh_ok
+    global last_update_time, last_update_iso, last_update_monotonic
+
+    last_update_monotonic = time.monotonic()
+    last_update_time = datetime.now()
+    last_update_iso = cached_at = last_update_time.isoformat()
+    physical_disks = data.get("physicalDisks", [])
+    virtual_disks = data.get("virtualDisks", [])
+    alerts = data.get("alerts", [])
+    cached_counts = {"physical": len(physical_disks), "virtual": len(virtual_disks), "alerts": len(alerts)}
+    data_json = orjson.dumps(data)
+    # The status object minus its closing brace, so _metadata can be appended without re-serializing
+    status_prefix = data_json[:-1] + b","
+    cached_blobs = {
+        "status_prefix": status_prefix,
+        "status": status_body(status_prefix, cached_at, None),
+        "physical": orjson.dumps({"disks": physical_disks, "count": cached_counts["physical"], "cached_at": cached_at}),
+        "virtual": orjson.dumps({"disks": virtual_disks, "count": cached_counts["virtual"], "cached_at": cached_at}),
+        "alerts": orjson.dumps({"alerts": alerts, "count": cached_counts["alerts"], "cached_at": cached_at}),
+        "info": orjson.dumps({**data.get("serverInfo", {}), "cached_at": cached_at}),
+    }
+    cached_size_bytes = len(data_json)
+    last_refresh_ok = True
+    # Published last: handlers treat a non-empty cached_hardware_data as "everything is set"
+    cached_hardware_data = data
+
+
+def status_body(status_prefix: bytes, cached_at: str, cache_age_warning: Optional[str]) -> bytes:
+    """Complete a pre-serialized status object with its _metadata member"""
+    metadata = orjson.dumps({"_metadata": {"cached_at": cached_at, "cache_age_warning": cache_age_warning}})
+    return status_prefix + metadata[1:]
+
+
+def cache_age_seconds() -> Optional[float]:
+    """Seconds since the last refresh, or None before the first one"""
+    if last_update_monotonic is None:
+        return None
+    return time.monotonic() - last_update_monotonic
+
+
+def blob_response(name: str) -> Response:
+    """Serve a response body that was serialized when the cache was last written"""
+    return Response(content=cached_blobs[name], media_type="application/json")
+
+
+def refresh_in_background():
+    """Start one background refresh unless one is already running, called from the event loop"""
+    if refresh_in_flight.is_set():
+        return
+    refresh_in_flight.set()
+
+    def run():
+        try:
+            update_hardware_data()
+        finally:
+            refresh_in_flight.clear()
+
+    EXECUTOR.submit(run)
+
+
+def backoff_delay(failures: int, base: float = 2, cap: float = 60) -> float:
+    """Seconds to wait after the given number of consecutive failures: exponential with jitter, capped"""
+    return min(cap, base * 2 ** failures * random.uniform(0.5, 1.5))
+
+
+def set_startup_event(event: threading.Event, loop_event: Optional[asyncio.Event]):
+    """Set a startup event from any thread and wake the coroutines awaiting its asyncio mirror"""
+    event.set()
+    if server_loop is not None and loop_event is not None:
+        with contextlib.suppress(RuntimeError):  # The loop is already closed during shutdown
+            server_loop.call_soon_threadsafe(loop_event.set)
+
+
 def initialize_idrac_client():
     """Initialize iDRAC client with retry logic and immediate data fetch"""
-    global idrac_client, hardware_monitor, cached_hardware_data, last_update_time
+    global idrac_client, hardware_monitor
 
     max_retries = 3
-    retry_delay = 5
 
     for attempt in range(max_retries):
         try:
-            print(f"🔌 Attempting to connect to iDRAC at {Config.IDRAC_IP} (attempt {attempt + 1}/{max_retries})")
+            print(f"🔌 Attempting to connect to iDRAC at {settings.IDRAC_IP} (attempt {attempt + 1}/{max_retries})")
 
             idrac_client = IDRACRedfishClient(
-                idrac_ip=Config.IDRAC_IP,
-                username=Config.IDRAC_USERNAME,
-                password=Config.IDRAC_PASSWORD
+                idrac_ip=settings.IDRAC_IP,
+                username=settings.IDRAC_USERNAME,
+                password=settings.IDRAC_PASSWORD,
+                # Health, power state and the disk lists must be re-read on every refresh
+                max_cache_ttl=settings.REFRESH_INTERVAL / 2
             )
             hardware_monitor = IDRACHardwareMonitor(idrac_client)
 
@@ -66,7 +166,7 @@ def initialize_idrac_client():
             test_data = hardware_monitor.get_full_hardware_status()
 
             if test_data and test_data.get("serverInfo"):
-                print(f"✅ Successfully connected to iDRAC at {Config.IDRAC_IP}")
+                print(f"✅ Successfully connected to iDRAC at {settings.IDRAC_IP}")
                 print(f"📦 Server: {test_data['serverInfo'].get('name', 'Unknown')}")
                 print(f"📊 Initial data: {len(test_data.get('physicalDisks', []))} physical disks, "
                       f"{len(test_data.get('virtualDisks', []))} virtual disks, "
@@ -74,11 +174,10 @@ def initialize_idrac_client():
 
                 # Cache initial data immediately
                 with update_lock:
-                    cached_hardware_data = test_data
-                    last_update_time = datetime.now()
+                    cache_hardware_data(test_data)
 
-                initialization_complete.set()
-                initial_data_fetched.set()
+                set_startup_event(initialization_complete, initialization_ready)
+                set_startup_event(initial_data_fetched, initial_data_ready)
                 print(f"✅ Initial data cached at {last_update_time}")
                 return True
             else:
@@ -86,111 +185,156 @@ def initialize_idrac_client():
 
         except Exception as e:
             print(f"❌ Connection attempt {attempt + 1} failed: {str(e)}")
-            if attempt < max_retries - 1:
-                print(f"⏳ Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
-            else:
+            if attempt == max_retries - 1:
                 print("❌ All connection attempts failed")
                 traceback.print_exc()
 
-    initialization_complete.set()  # Set even if failed, to unblock waiting threads
+        if attempt < max_retries - 1:
+            retry_delay = backoff_delay(attempt)
+            print(f"⏳ Retrying in {retry_delay:.1f} seconds...")
+            time.sleep(retry_delay)
+
+    set_startup_event(initialization_complete, initialization_ready)  # Set even if failed, to unblock waiters
     return False
 
 
 def update_hardware_data():
-    """Update hardware data from iDRAC with thread safety"""
-    global cached_hardware_data, last_update_time
+    """Update hardware data from iDRAC, concurrent callers share one fetch"""
+    global last_refresh_ok
 
     if not hardware_monitor:
         print("❌ Hardware monitor not available")
         return False
 
-    with update_lock:
-        try:
-            print(f"🔄 Fetching hardware data from iDRAC {Config.IDRAC_IP}...")
-            start_time = time.time()
+    if not update_lock.acquire(blocking=False):
+        # Another refresh is already fetching: wait for it and report its result instead of fetching again
+        print("⏳ Refresh already in progress, waiting for it...")
+        with update_lock:
+            return last_refresh_ok
 
-            data = hardware_monitor.get_full_hardware_status()
+    try:
+        print(f"🔄 Fetching hardware data from iDRAC {settings.IDRAC_IP}...")
+        start_time = time.time()
 
-            if data and data.get("serverInfo"):
-                cached_hardware_data = data
-                last_update_time = datetime.now()
+        data = hardware_monitor.get_full_hardware_status()
 
-                fetch_time = round(time.time() - start_time, 2)
-                print(f"✅ Hardware data updated at {last_update_time} (took {fetch_time}s)")
+        if data and data.get("serverInfo"):
+            cache_hardware_data(data)
 
-                # Log summary
-                physical_count = len(data.get("physicalDisks", []))
-                virtual_count = len(data.get("virtualDisks", []))
-                alert_count = len(data.get("alerts", []))
-                print(
-                    f"📊 Summary: {physical_count} physical disks, {virtual_count} virtual disks, {alert_count} alerts")
+            fetch_time = round(time.time() - start_time, 2)
+            print(f"✅ Hardware data updated at {last_update_time} (took {fetch_time}s)")
 
-                return True
-            else:
-                print("⚠️ Received empty or invalid data from iDRAC")
-                return False
+            # Log summary
+            print(f"📊 Summary: {cached_counts['physical']} physical disks, "
+                  f"{cached_counts['virtual']} virtual disks, {cached_counts['alerts']} alerts")
+        else:
+            print("⚠️ Received empty or invalid data from iDRAC")
+            last_refresh_ok = False
 
-        except Exception as e:
-            print(f"❌ Failed to update hardware data: {str(e)}")
-            traceback.print_exc()
-            return False
+    except Exception as e:
+        print(f"❌ Failed to update hardware data: {str(e)}")
+        traceback.print_exc()
+        last_refresh_ok = False
+
+    finally:
+        update_lock.release()
+
+    return last_refresh_ok
+
+
+async def wait_for_stop(timeout: float) -> bool:
+    """Sleep for up to timeout seconds, returning True as soon as monitoring is stopped"""
+    try:
+        await asyncio.wait_for(stop_monitoring.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
 
 
-def monitoring_worker():
-    """Background worker for periodic hardware monitoring"""
-    global is_monitoring, cached_hardware_data
+async def monitoring_worker():
+    """Background task for periodic hardware monitoring, blocking iDRAC calls run on EXECUTOR"""
+    loop = asyncio.get_running_loop()
 
-    print(f"🚀 Starting hardware monitoring (interval: {Config.REFRESH_INTERVAL}s)")
+    print(f"🚀 Starting hardware monitoring (interval: {settings.REFRESH_INTERVAL}s)")
 
-    # Wait for initial data to be fetched
+    # Wait for initial data to be fetched (max 2 minutes), or for monitoring to be stopped
     print("⏳ Waiting for initial data fetch...")
-    initial_data_fetched.wait(timeout=120)  # Wait max 2 minutes
+    if not initial_data_fetched.is_set():
+        waiters = {asyncio.create_task(initial_data_ready.wait()), asyncio.create_task(stop_monitoring.wait())}
+        try:
+            await asyncio.wait(waiters, timeout=120, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for waiter in waiters:
+                waiter.cancel()
+        if stop_monitoring.is_set():
+            return
 
     if not cached_hardware_data:
         print("⚠️ No initial data available, attempting first fetch...")
-        update_hardware_data()
+        await loop.run_in_executor(EXECUTOR, update_hardware_data)
 
     consecutive_failures = 0
     max_consecutive_failures = 5
+    error_streak = 0  # Consecutive failed refreshes, drives the retry backoff; reset on first success
+    delay = settings.REFRESH_INTERVAL
 
-    while is_monitoring:
+    while not await wait_for_stop(delay):
         try:
-            time.sleep(Config.REFRESH_INTERVAL)
-
-            if is_monitoring:  # Check again in case we were stopped
-                success = update_hardware_data()
-
-                if success:
-                    consecutive_failures = 0
-                else:
-                    consecutive_failures += 1
-                    if consecutive_failures >= max_consecutive_failures:
-                        print(f"⚠️ {consecutive_failures} consecutive failures. Attempting to reconnect...")
-                        initialize_idrac_client()
-                        consecutive_failures = 0
-
+            success = await loop.run_in_executor(EXECUTOR, update_hardware_data)
         except Exception as e:
             print(f"❌ Monitoring worker error: {str(e)}")
-            time.sleep(30)  # Wait 30 seconds before retrying
+            success = False
+
+        if success:
+            consecutive_failures = 0
+            error_streak = 0
+            delay = settings.REFRESH_INTERVAL
+            continue
+
+        # Retry soon after a blip, backing off up to a minute (never past the normal
+        # interval) while the iDRAC stays unreachable
+        delay = min(settings.REFRESH_INTERVAL, backoff_delay(error_streak))
+        error_streak += 1
+        print(f"⏳ Refresh failed, retrying in {delay:.1f} seconds...")
+
+        consecutive_failures += 1
+        if consecutive_failures >= max_consecutive_failures:
+            print(f"⚠️ {consecutive_failures} consecutive failures. Attempting to reconnect...")
+            await loop.run_in_executor(EXECUTOR, initialize_idrac_client)
+            consecutive_failures = 0
+
+
+async def wait_for_initialization(timeout: float) -> bool:
+    """Wait for the initial iDRAC connection without blocking the event loop or holding a thread"""
+    if initialization_complete.is_set() or initialization_ready is None:
+        return initialization_complete.is_set()
+    try:
+        await asyncio.wait_for(initialization_ready.wait(), timeout)
+        return True
+    except asyncio.TimeoutError:
+        return False
 
 
 @app.on_event("startup")
 async def startup_event():
     """Start background monitoring on app startup"""
-    global monitoring_thread, is_monitoring
+    global monitoring_task, stop_monitoring, is_monitoring, server_loop, initialization_ready, initial_data_ready
 
     print("🎯 Starting up iDRAC Hardware Monitor API...")
 
+    # Create the asyncio events before the executor thread that sets them is started
+    server_loop = asyncio.get_running_loop()
+    initialization_ready = asyncio.Event()
+    initial_data_ready = asyncio.Event()
+    stop_monitoring = asyncio.Event()
+
     # Initialize iDRAC client and fetch initial data in background
-    executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
-    executor.submit(initialize_idrac_client)
+    EXECUTOR.submit(initialize_idrac_client)
 
-    # Start monitoring thread
+    # Start monitoring task
     is_monitoring = True
-    monitoring_thread = threading.Thread(target=monitoring_worker, daemon=True)
-    monitoring_thread.start()
-    print("🎯 Background monitoring thread started")
+    monitoring_task = asyncio.create_task(monitoring_worker())
+    print("🎯 Background monitoring task started")
 
 
 @app.on_event("shutdown")
@@ -198,6 +342,13 @@ async def shutdown_event():
     """Stop background monitoring on app shutdown"""
     global is_monitoring
     is_monitoring = False
+    if monitoring_task:
+        # Wake the task from its sleep, and interrupt any wait on a refresh in progress
+        stop_monitoring.set()
+        monitoring_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await monitoring_task
+    EXECUTOR.shutdown(wait=False, cancel_futures=True)
     print("🛑 Background monitoring stopped")
 
 
@@ -211,8 +362,8 @@ async def root():
         "message": "iDRAC8 Hardware Monitor API",
         "version": "1.0.0",
         "status": "ready" if (is_ready and has_data) else "initializing",
-        "idrac_ip": Config.IDRAC_IP,
-        "last_update": last_update_time.isoformat() if last_update_time else None,
+        "idrac_ip": settings.IDRAC_IP,
+        "last_update": last_update_iso,
         "cache_available": has_data
     }
 
@@ -220,9 +371,7 @@ async def root():
 @app.get("/api/health")
 async def health_check():
     """API health check with detailed status"""
-    cache_age = None
-    if last_update_time:
-        cache_age = (datetime.now() - last_update_time).total_seconds()
+    cache_age = cache_age_seconds()
 
     is_ready = initialization_complete.is_set()
     has_data = cached_hardware_data is not None
@@ -230,10 +379,10 @@ async def health_check():
     return {
         "status": "healthy" if (is_ready and has_data) else "degraded",
         "idrac_connected": is_ready,
-        "last_update": last_update_time.isoformat() if last_update_time else None,
+        "last_update": last_update_iso,
         "cache_status": "available" if has_data else "empty",
         "cache_age_seconds": cache_age,
-        "refresh_interval": Config.REFRESH_INTERVAL,
+        "refresh_interval": settings.REFRESH_INTERVAL,
         "initialization_complete": is_ready
     }
 
@@ -242,8 +391,8 @@ async def health_check():
 async def get_server_status():
     """Get complete server hardware status from cache"""
     # Wait for initialization to complete (max 10 seconds)
-    if not initialization_complete.wait(timeout=10):
-        return JSONResponse(
+    if not await wait_for_initialization(timeout=10):
+        return ORJSONResponse(
             status_code=202,
             content={
                 "message": "System still initializing, please retry in a few seconds",
@@ -254,11 +403,12 @@ async def get_server_status():
     if not cached_hardware_data:
         # Try one manual update
         print("📡 No cached data available, attempting manual fetch...")
-        success = update_hardware_data()
+        loop = asyncio.get_event_loop()
+        success = await loop.run_in_executor(EXECUTOR, update_hardware_data)
 
         if not success or not cached_hardware_data:
             # Return empty structure instead of error
-            return JSONResponse(content={
+            return ORJSONResponse(content={
                 "serverInfo": {},
                 "physicalDisks": [],
                 "virtualDisks": [],
@@ -270,29 +420,26 @@ async def get_server_status():
                 }
             })
 
-    # Check cache age and warn if stale
-    cache_age_warning = None
-    if last_update_time:
-        cache_age = (datetime.now() - last_update_time).total_seconds()
-        if cache_age > Config.REFRESH_INTERVAL * 3:  # If cache is 3x older than refresh interval
-            cache_age_warning = f"Cache is {int(cache_age)} seconds old"
-
-    response_data = {
-        **cached_hardware_data,
-        "_metadata": {
-            "cached_at": last_update_time.isoformat() if last_update_time else None,
-            "cache_age_warning": cache_age_warning
-        }
-    }
+    # Check cache age and warn if stale, reading each cache global once
+    # since a refresh thread may replace them while we run
+    blobs, cached_at, cache_age = cached_blobs, last_update_iso, cache_age_seconds()
+    if cache_age > settings.REFRESH_INTERVAL * 2:
+        # The monitoring task has fallen behind: serve what we have and refresh in the background
+        refresh_in_background()
+    if cache_age <= settings.REFRESH_INTERVAL * 3:  # Stale once 3x older than refresh interval
+        # Fresh cache: serve the body serialized at refresh time
+        return Response(content=blobs["status"], media_type="application/json")
 
-    return JSONResponse(content=response_data)
+    # Stale cache: only the metadata carrying the age warning is serialized per request
+    body = status_body(blobs["status_prefix"], cached_at, f"Cache is {int(cache_age)} seconds old")
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/server/refresh")
 async def refresh_server_data():
     """Manually trigger a refresh of server data"""
     # Wait for initialization
-    if not initialization_complete.wait(timeout=5):
+    if not await wait_for_initialization(timeout=5):
         raise HTTPException(
             status_code=503,
             detail="System still initializing"
@@ -304,19 +451,21 @@ async def refresh_server_data():
             detail="iDRAC client not available"
         )
 
-    # Perform synchronous update in background
+    # Perform synchronous update in background, bypassing the Redfish response cache
     def do_refresh():
+        hardware_monitor.client.invalidate()
         return update_hardware_data()
 
     # Run in thread pool to avoid blocking
     loop = asyncio.get_event_loop()
-    success = await loop.run_in_executor(None, do_refresh)
+    success = await loop.run_in_executor(EXECUTOR, do_refresh)
 
-    if success and cached_hardware_data:
+    data, updated_at = cached_hardware_data, last_update_iso
+    if success and data:
         return {
             "message": "Hardware data refreshed successfully",
-            "timestamp": last_update_time.isoformat() if last_update_time else None,
-            "data": cached_hardware_data
+            "timestamp": updated_at,
+            "data": data
         }
     else:
         raise HTTPException(
@@ -329,110 +478,85 @@ async def refresh_server_data():
 async def get_physical_disks():
     """Get physical disks status from cache"""
     # Wait for initialization
-    initialization_complete.wait(timeout=5)
+    await wait_for_initialization(timeout=5)
 
     if not cached_hardware_data:
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "disks": [],
             "count": 0,
             "cached_at": None,
             "status": "no_data"
         })
 
-    disks = cached_hardware_data.get("physicalDisks", [])
-    return JSONResponse(content={
-        "disks": disks,
-        "count": len(disks),
-        "cached_at": last_update_time.isoformat() if last_update_time else None
-    })
+    return blob_response("physical")
 
 
 @app.get("/api/disks/virtual")
 async def get_virtual_disks():
     """Get virtual disks and RAID status from cache"""
     # Wait for initialization
-    initialization_complete.wait(timeout=5)
+    await wait_for_initialization(timeout=5)
 
     if not cached_hardware_data:
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "disks": [],
             "count": 0,
             "cached_at": None,
             "status": "no_data"
         })
 
-    disks = cached_hardware_data.get("virtualDisks", [])
-    return JSONResponse(content={
-        "disks": disks,
-        "count": len(disks),
-        "cached_at": last_update_time.isoformat() if last_update_time else None
-    })
+    return blob_response("virtual")
 
 
 @app.get("/api/alerts")
 async def get_alerts():
     """Get system alerts from cache"""
     # Wait for initialization
-    initialization_complete.wait(timeout=5)
+    await wait_for_initialization(timeout=5)
 
     if not cached_hardware_data:
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "alerts": [],
             "count": 0,
             "cached_at": None,
             "status": "no_data"
         })
 
-    alerts = cached_hardware_data.get("alerts", [])
-    return JSONResponse(content={
-        "alerts": alerts,
-        "count": len(alerts),
-        "cached_at": last_update_time.isoformat() if last_update_time else None
-    })
+    return blob_response("alerts")
 
 
 @app.get("/api/server/info")
 async def get_server_info():
     """Get basic server information from cache"""
     # Wait for initialization
-    initialization_complete.wait(timeout=5)
+    await wait_for_initialization(timeout=5)
 
     if not cached_hardware_data:
-        return JSONResponse(content={
+        return ORJSONResponse(content={
             "serverInfo": {},
             "cached_at": None,
             "status": "no_data"
         })
 
-    info = cached_hardware_data.get("serverInfo", {})
-    return JSONResponse(content={
-        **info,
-        "cached_at": last_update_time.isoformat() if last_update_time else None
-    })
+    return blob_response("info")
 
 
 @app.get("/api/cache/stats")
 async def get_cache_stats():
     """Get cache statistics"""
-    cache_size = 0
-    if cached_hardware_data:
-        cache_size = len(json.dumps(cached_hardware_data))
-
-    cache_age = None
-    if last_update_time:
-        cache_age = (datetime.now() - last_update_time).total_seconds()
+    counts, updated_at, cache_age = cached_counts, last_update_iso, cache_age_seconds()
 
     return {
-        "cache_available": cached_hardware_data is not None,
-        "cache_size_bytes": cache_size,
-        "last_update": last_update_time.isoformat() if last_update_time else None,
+        "cache_available": updated_at is not None,
+        "cache_size_bytes": cached_size_bytes,
+        "last_update": updated_at,
         "cache_age_seconds": cache_age,
-        "refresh_interval": Config.REFRESH_INTERVAL,
+        "refresh_interval": settings.REFRESH_INTERVAL,
         "is_monitoring": is_monitoring,
         "initialization_complete": initialization_complete.is_set(),
-        "physical_disks_count": len(cached_hardware_data.get("physicalDisks", [])) if cached_hardware_data else 0,
-        "virtual_disks_count": len(cached_hardware_data.get("virtualDisks", [])) if cached_hardware_data else 0,
-        "alerts_count": len(cached_hardware_data.get("alerts", [])) if cached_hardware_data else 0
+        "physical_disks_count": counts["physical"],
+        "virtual_disks_count": counts["virtual"],
+        "alerts_count": counts["alerts"]
     }
 
 
@@ -441,15 +565,20 @@ if __name__ == "__main__":
 
     print("=" * 60)
     print(f"🚀 Starting iDRAC8 Hardware Monitor API")
-    print(f"📡 Target iDRAC: {Config.IDRAC_IP}")
-    print(f"🌐 API Server: {Config.API_HOST}:{Config.API_PORT}")
-    print(f"⏱️  Refresh interval: {Config.REFRESH_INTERVAL} seconds")
+    print(f"📡 Target iDRAC: {settings.IDRAC_IP}")
+    print(f"🌐 API Server: {settings.API_HOST}:{settings.API_PORT}")
+    print(f"⏱️  Refresh interval: {settings.REFRESH_INTERVAL} seconds")
     print("=" * 60)
 
     uvicorn.run(
         "main:app",
-        host=Config.API_HOST,
-        port=Config.API_PORT,
-        reload=False,  # Set to False for production
+        host=settings.API_HOST,
+        port=settings.API_PORT,
+        # The reloader adds a file watcher and a supervisor process, so only use it in dev
+        reload=settings.ENV == "dev",
+        # uvloop/httptools are C implementations of the event loop and HTTP parser,
+        # "auto" picks them when installed and falls back to asyncio/h11 otherwise
+        loop="auto",
+        http="auto",
         log_level="info"
     )
\ No newline at end of file
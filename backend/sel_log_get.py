@@ -6,8 +6,15 @@ import warnings
 import requests
 import xml.etree.ElementTree as ET
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import urllib3
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
 # Suppress only the single InsecureRequestWarning from urllib3 needed.
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 warnings.filterwarnings("ignore", message="Unverified HTTPS request")
@@ -32,17 +39,16 @@ class IDRACSelFetcher:
         self.base = f"https://{host}"
         self.user = user
         self.pwd = pwd
-        # session for Redfish
-        self.rf = requests.Session()
-        self.rf.verify = False
-        self.rf.auth = (user, pwd)
-        adapter = WeakDHAdapter()
-        self.rf.mount("https://", adapter)
-        # session for legacy endpoint
-        self.legacy = requests.Session()
-        self.legacy.verify = False
-        self.legacy.auth = (user, pwd)
-        self.legacy.mount("https://", adapter)
+        # one keep-alive session for both Redfish and the legacy endpoint,
+        # so every request after the first reuses the TLS connection
+        self.session = requests.Session()
+        self.session.verify = False
+        self.session.auth = (user, pwd)
+        self.session.headers["Connection"] = "keep-alive"
+        adapter = WeakDHAdapter(pool_connections=1, pool_maxsize=4)
+        self.session.mount("https://", adapter)
+        # Redfish SEL endpoint that answered last time, tried alone on the next call
+        self._working_endpoint = None
 
     def fetch_sel_redfish(self):
         """Attempt to fetch SEL via Redfish."""
@@ -53,19 +59,37 @@ class IDRACSelFetcher:
             "/redfish/v1/Systems/System.Embedded.1/LogServices/SEL/Entries",
             "/redfish/v1/Managers/1/LogServices/Sel/Entries",
         ]
-        for ep in endpoints:
-            url = self.base + ep
-            print(f"use url :{url}")
-            try:
-                resp = self.rf.get(url, timeout=15)
-                if resp.status_code == 200:
-                    data = resp.json()
-                    members = data.get("Members", [])
-                    if members:
-                        return members
-                # if empty or 404, continue
-            except Exception:
-                pass
+        if self._working_endpoint:
+            members = self._probe_redfish(self._working_endpoint)
+            if members:
+                return members
+            # it stopped answering, rediscover from the full list
+            self._working_endpoint = None
+
+        # probe every endpoint at once; the first one in list order with entries wins
+        pool = ThreadPoolExecutor(max_workers=len(endpoints))
+        try:
+            for ep, members in zip(endpoints, pool.map(self._probe_redfish, endpoints)):
+                if members:
+                    self._working_endpoint = ep
+                    return members
+        finally:
+            # don't wait on slower probes once we have an answer
+            pool.shutdown(wait=False, cancel_futures=True)
+        return []
+
+    def _probe_redfish(self, ep):
+        """Return the SEL members from one Redfish endpoint, or [] if it has none."""
+        url = self.base + ep
+        print(f"use url :{url}")
+        try:
+            resp = self.session.get(url, timeout=15)
+            if resp.status_code == 200 and resp.content:
+                data = _json_loads(resp.content)
+                return data.get("Members", [])
+            # if empty or 404, try the next one
+        except Exception:
+            pass
         return []
 
     def fetch_sel_legacy(self):
@@ -73,30 +97,35 @@ class IDRACSelFetcher:
         """Fetch SEL via the legacy XML endpoint."""
         login_url = self.base + "/data/login"
         # ignore login XML, just establish cookies
-        self.legacy.post(login_url,
-                         data=f"user={self.user}&password={self.pwd}",
-                         headers={'Content-Type':'application/x-www-form-urlencoded'},
-                         timeout=10)
+        self.session.post(login_url,
+                          data=f"user={self.user}&password={self.pwd}",
+                          headers={'Content-Type':'application/x-www-form-urlencoded'},
+                          timeout=10)
         url = self.base + "/data?get=eventLogEntries"
         try:
-            resp = self.legacy.post(url,
-                                    headers={'Accept':'application/xml'},
-                                    data="", timeout=15)
-            if resp.status_code != 200:
-                return []
-            root = ET.fromstring(resp.text)
-            entries = []
-            for e in root.findall(".//eventLogEntry"):
-                ts = e.findtext("dateTime") or datetime.now().isoformat()
-                msg = e.findtext("description") or "<no desc>"
-                sev = (e.findtext("severity") or "Informational").capitalize()
-                entries.append({
-                    "Id": len(entries)+1,
-                    "Created": ts,
-                    "Message": msg,
-                    "Severity": sev,
-                })
-            return entries
+            with self.session.post(url,
+                                   headers={'Accept':'application/xml'},
+                                   data="", timeout=15, stream=True) as resp:
+                if resp.status_code != 200:
+                    return []
+                # parse entries as they arrive and drop each one once read,
+                # instead of holding the whole body and its tree in memory
+                resp.raw.decode_content = True
+                entries = []
+                for _, e in ET.iterparse(resp.raw, events=("end",)):
+                    if e.tag != "eventLogEntry":
+                        continue
+                    ts = e.findtext("dateTime") or datetime.now().isoformat()
+                    msg = e.findtext("description") or "<no desc>"
+                    sev = (e.findtext("severity") or "Informational").capitalize()
+                    entries.append({
+                        "Id": len(entries)+1,
+                        "Created": ts,
+                        "Message": msg,
+                        "Severity": sev,
+                    })
+                    e.clear()
+                return entries
         except Exception:
             return []
 
@@ -107,13 +136,19 @@ class IDRACSelFetcher:
             return entries
         return self.fetch_sel_legacy()
 
+@lru_cache
+def get_fetcher(host: str, user: str, pwd: str) -> IDRACSelFetcher:
+    """Return one fetcher (and its connection pool) per iDRAC for the life of the process"""
+    return IDRACSelFetcher(host, user, pwd)
+
+
 def main():
     # Read from environment or use defaults
     host = os.getenv("IDRAC_IP", "10.88.51.66")
     user = os.getenv("IDRAC_USER", "root")
     pwd  = os.getenv("IDRAC_PASS", "1111")
 
-    fetcher = IDRACSelFetcher(host, user, pwd)
+    fetcher = get_fetcher(host, user, pwd)
     print(f"Connecting to iDRAC at {host} for SEL logs...")
     logs = fetcher.get_sel_entries()
 
@@ -121,30 +156,31 @@ def main():
         print("❌ No SEL entries found by either Redfish or legacy API.")
         sys.exit(1)
 
+    now_iso = datetime.now().isoformat()
+    # Keep only critical and warning entries, lowercasing the severity once per entry
+    alerts = [
+        {
+            "id": entry.get("Id", -0),
+            "message": entry.get("Message", "Unknown alert"),
+            "severity": severity,
+            "timestamp": entry.get("Created", now_iso),
+            "messageId": entry.get("MessageId", ""),
+            "entryType": entry.get("EntryType", "Event"),
+            "sensorType": entry.get("SensorType", ""),
+            "sensorNumber": entry.get("SensorNumber", 0),
+            "acknowledged": False
+        }
+        for entry in logs
+        for severity in (str(entry.get("Severity", "")).lower(),)
+        if severity in ("critical", "warning")
+    ]
+
+    # One write per section instead of one per entry
     print(f"✅ Retrieved {len(logs)} SEL entries:")
-    for entry in logs:
-        ts = entry.get("Created", "")
-        sev = entry.get("Severity", "")
-        msg = entry.get("Message", "")
-        Id = entry.get("Id", -0)
-        print(f"- [{ts}] {sev}: {msg}")
-        severity = str(entry.get("Severity", "")).lower()
-        entry_type = str(entry.get("EntryType", "")).lower()
-
-        # Include critical, warning, and some informational alerts
-        if severity in ["critical", "warning"]:
-            alert = {
-                "id": Id,
-                "message": entry.get("Message", "Unknown alert"),
-                "severity": severity if severity else "information",
-                "timestamp": entry.get("Created", datetime.now().isoformat()),
-                "messageId": entry.get("MessageId", ""),
-                "entryType": entry.get("EntryType", "Event"),
-                "sensorType": entry.get("SensorType", ""),
-                "sensorNumber": entry.get("SensorNumber", 0),
-                "acknowledged": False
-            }
-            print(alert)
+    print("\n".join(f"- [{entry.get('Created', '')}] {entry.get('Severity', '')}: {entry.get('Message', '')}"
+                    for entry in logs))
+    if alerts:
+        print("\n".join(map(str, alerts)))
 
 if __name__ == "__main__":
     os.environ.setdefault("IDRAC_IP","10.88.51.66")